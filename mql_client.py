@@ -1,11 +1,102 @@
 import os
-import json
-from time import sleep
-from threading import Thread, Lock
-from os.path import join, exists
+import mmap
+import atexit
+import asyncio
+import struct
+from time import sleep, monotonic
+from queue import SimpleQueue, Empty
+from threading import Thread
+from os.path import join, exists, basename
 from traceback import print_exc
+from itertools import count
 from datetime import datetime, timezone, timedelta
 
+# Prefer the fastest available JSON backend; orjson parses bytes directly.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    try:
+        import ujson as json
+    except ImportError:
+        import json
+
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+# Watch the communication files for changes instead of polling when watchdog is available.
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+
+    try:
+        from watchdog.observers.inotify import InotifyObserver
+
+        # inotify reports when a writer closes a file, so the file is complete by then
+        _OBSERVER_EMITS_CLOSE = issubclass(Observer, InotifyObserver)
+    except Exception:
+        _OBSERVER_EMITS_CLOSE = False
+
+    class _FileEventForwarder(FileSystemEventHandler):
+        """
+        Forwards the names of written or replaced files to the watch thread.
+
+        Where the observer emits close events, only closed and moved files are forwarded,
+        as created and modified events fire while MetaTrader is still writing the file.
+        Files kept open by MetaTrader are never closed, so their writes are always forwarded.
+        """
+
+        def __init__(self, file_events, open_file_names=()):
+            super().__init__()
+            self.file_events = file_events
+            self.open_file_names = frozenset(open_file_names)
+
+        def on_created(self, event):
+            if not _OBSERVER_EMITS_CLOSE and not event.is_directory:
+                self.file_events.put(basename(event.src_path))
+
+        def on_modified(self, event):
+            if not event.is_directory:
+                file_name = basename(event.src_path)
+                if not _OBSERVER_EMITS_CLOSE or file_name in self.open_file_names:
+                    self.file_events.put(file_name)
+
+        def on_closed(self, event):
+            if not event.is_directory:
+                self.file_events.put(basename(event.src_path))
+
+        def on_moved(self, event):
+            if not event.is_directory:
+                self.file_events.put(basename(event.dest_path))
+except ImportError:
+    Observer = None
+
+# simdjson can parse historic data lazily, so bars are only materialized when accessed (opt-in).
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# Fast 64-bit content hash used to detect unchanged files without re-parsing them.
+try:
+    import xxhash
+
+    _hash_bytes = xxhash.xxh3_64_intdigest
+except ImportError:
+    _hash_bytes = hash
+
+# Layout of the tick ring buffer written by MetaTrader: [u64 head][slot x _TICK_RING_SLOTS].
+# Slot `position % _TICK_RING_SLOTS` holds the tick with sequence number `position + 1`.
+_TICK_RING_SLOTS = 1024
+_TICK_RING_HEAD = struct.Struct('<Q')
+_TICK_RING_SLOT = struct.Struct('<Q16sddd')  # seq, symbol, bid, ask, tick_value
+_TICK_RING_SEQ = struct.Struct('<Q')  # Leading seq of a slot, re-read to detect torn slots
+_TICK_RING_SIZE = _TICK_RING_HEAD.size + _TICK_RING_SLOTS * _TICK_RING_SLOT.size
+
 
 class mql_client:
     """
@@ -13,7 +104,7 @@ class mql_client:
 
     This class handles subscribing to market data, managing orders, and retrieving
     historic data by communicating with MetaTrader through designated files. It
-    supports asynchronous operations using multiple threads and provides event
+    supports asynchronous operations using a background watch thread and provides event
     handling through an optional event_handler.
     """
 
@@ -21,7 +112,10 @@ class mql_client:
                  sleep_delay=0.005,
                  max_retry_command_seconds=10,
                  load_orders_from_file=True,
-                 verbose=True
+                 verbose=True,
+                 watch_fallback_delay=1.0,
+                 lazy_historic_data=False,
+                 use_tick_ring_buffer=False
                  ):
         """
         Initializes the mql_client instance with configuration parameters.
@@ -30,17 +124,26 @@ class mql_client:
             event_handler (object, optional): An object with callback methods
                 to handle various events. Defaults to None.
             metatrader_dir_path (str): Path to the MetaTrader directory.
-            sleep_delay (float): Delay in seconds between file checks.
+            sleep_delay (float): Delay in seconds between file checks when polling.
             max_retry_command_seconds (int): Maximum seconds to retry sending a command.
             load_orders_from_file (bool): Whether to load existing orders from file on startup.
             verbose (bool): If True, prints verbose output for debugging.
+            watch_fallback_delay (float): Delay in seconds between full rescans when
+                file system events are available (requires watchdog).
+            lazy_historic_data (bool): If True, historic data is parsed into lazy, read-only
+                simdjson objects instead of dicts (requires simdjson).
+            use_tick_ring_buffer (bool): If True, ticks are read from the tick ring buffer.
+                Enable it together with `publishTicksToRingBuffer` in MetaTrader.
         """
         self.event_handler = event_handler
         self.sleep_delay = sleep_delay
         self.max_retry_command_seconds = max_retry_command_seconds
         self.load_orders_from_file = load_orders_from_file
         self.verbose = verbose
-        self.command_id = 0
+        self.watch_fallback_delay = watch_fallback_delay
+        self.lazy_historic_data = lazy_historic_data and simdjson is not None
+        self.use_tick_ring_buffer = use_tick_ring_buffer
+        self._id_counter = count(1)  # Source of command IDs, safe to share between threads
 
         # Verify that the MetaTrader directory exists
         if not exists(metatrader_dir_path):
@@ -48,6 +151,7 @@ class mql_client:
             exit()
 
         # Define paths to various communication files
+        self.path_mql_stuff = join(metatrader_dir_path, 'mql_stuff')
         self.path_orders = join(metatrader_dir_path, 'mql_stuff', 'mql_VS_Orders.txt')
         self.path_messages = join(metatrader_dir_path, 'mql_stuff', 'mql_VS_Messages.txt')
         self.path_market_data = join(metatrader_dir_path, 'mql_stuff', 'mql_VS_Market_Data.txt')
@@ -57,17 +161,21 @@ class mql_client:
         self.path_orders_stored = join(metatrader_dir_path, 'mql_stuff', 'mql_VS_Orders_Stored.txt')
         self.path_messages_stored = join(metatrader_dir_path, 'mql_stuff', 'mql_VS_Messages_Stored.txt')
         self.path_commands_prefix = join(metatrader_dir_path, 'mql_stuff', 'mql_VS_Commands_')
+        self.path_ticks = join(metatrader_dir_path, 'mql_stuff', 'mql_VS_Ticks.bin')
 
         self.num_command_files = 50  # Number of command files to cycle through
+        self._command_paths = tuple(f'{self.path_commands_prefix}{i}.txt'
+                                    for i in range(self.num_command_files))
+        self._command_file_names = tuple(basename(path) for path in self._command_paths)
 
         # Initialize internal state variables
         self._last_messages_millis = 0
-        self._last_open_orders_str = ""
-        self._last_messages_str = ""
-        self._last_market_data_str = ""
-        self._last_bar_data_str = ""
-        self._last_historic_data_str = ""
-        self._last_historic_trades_str = ""
+        self._last_open_orders_hash = None
+        self._last_messages_hash = None
+        self._last_market_data_hash = None
+        self._last_bar_data_hash = None
+        self._last_historic_data_hash = None
+        self._last_historic_trades_hash = None
 
         # Initialize data storage dictionaries
         self.open_orders = {}
@@ -80,38 +188,54 @@ class mql_client:
         self._last_bar_data = {}
         self._last_market_data = {}
 
+        # (symbol, timeframe) pairs by their "SYMBOL_TIMEFRAME" data key
+        self._bar_key_cache = {}
+
+        # Memory-mapped tick ring buffer and the position of the next tick to read
+        self._tick_mmap = None
+        self._tick_ring_id = None  # (st_dev, st_ino) of the mapped file
+        self._tick_ring_tail = 0
+
+        # Event handler whose optional on_ticks batch callback was last looked up
+        self._batch_handler = None
+        self._batch_on_ticks = None
+
         # Control flags for thread execution
         self.ACTIVE = True
         self.START = False
 
-        self.lock = Lock()  # Lock to synchronize command sending
-
         # Load existing messages and orders if configured
         self.load_messages()
 
         if self.load_orders_from_file:
             self.load_orders()
 
-        # Start background threads for handling different types of data
-        self.messages_thread = Thread(target=self.check_messages, args=())
-        self.messages_thread.daemon = True
-        self.messages_thread.start()
-
-        self.market_data_thread = Thread(target=self.check_market_data, args=())
-        self.market_data_thread.daemon = True
-        self.market_data_thread.start()
-
-        self.bar_data_thread = Thread(target=self.check_bar_data, args=())
-        self.bar_data_thread.daemon = True
-        self.bar_data_thread.start()
-
-        self.open_orders_thread = Thread(target=self.check_open_orders, args=())
-        self.open_orders_thread.daemon = True
-        self.open_orders_thread.start()
-
-        self.historic_data_thread = Thread(target=self.check_historic_data, args=())
-        self.historic_data_thread.daemon = True
-        self.historic_data_thread.start()
+        # Map each watched file name to its path and handler
+        self._file_handlers = {
+            basename(path): (path, handler) for path, handler in (
+                (self.path_orders, self._handle_open_orders),
+                (self.path_messages, self._handle_messages),
+                (self.path_market_data, self._handle_market_data),
+                (self.path_bar_data, self._handle_bar_data),
+                (self.path_historic_data, self._handle_historic_data),
+                (self.path_historic_trades, self._handle_historic_trades),
+            )
+        }
+        if self.use_tick_ring_buffer:
+            self._file_handlers[basename(self.path_ticks)] = (self.path_ticks, self._handle_tick_ring)
+        self._file_events = SimpleQueue()  # Names of changed files, None to rescan all
+
+        # Start a background thread persisting stored orders and messages
+        self._persist_queue = SimpleQueue()  # (file path, content) pairs to write
+        self.persist_thread = Thread(target=self.persist_files, args=())
+        self.persist_thread.daemon = True
+        self.persist_thread.start()
+        atexit.register(self.flush_persisted_files)
+
+        # Start a single background thread watching all communication files
+        self.watch_thread = Thread(target=self.watch_files, args=())
+        self.watch_thread.daemon = True
+        self.watch_thread.start()
 
         self.reset_command_ids()  # Reset command IDs on initialization
 
@@ -120,8 +244,9 @@ class mql_client:
             self.start()
 
     def start(self):
-        """Sets the START flag to True, allowing threads to begin processing."""
+        """Sets the START flag to True, allowing the watch thread to begin processing."""
         self.START = True
+        self._file_events.put(None)  # Process the current content of all files right away
 
     def try_read_file(self, file_path):
         """
@@ -131,20 +256,38 @@ class mql_client:
             file_path (str): Path to the file to be read.
 
         Returns:
-            str: Content of the file if successful, else an empty string.
+            bytes: Raw content of the file if successful, else an empty bytes object.
         """
         try:
-            if exists(file_path):
-                with open(file_path) as f:
-                    text = f.read()
-                return text
+            with open(file_path, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            # The file has not been written yet or was just removed
+            pass
         except (IOError, PermissionError):
             # Ignore these exceptions as they can occur during concurrent access
             pass
         except:
             # Print stack trace for any other unexpected exceptions
             print_exc()
-        return ''
+        return b''
+
+    def try_parse_json(self, text, loads=_json_loads):
+        """
+        Attempts to parse the content of a file.
+
+        Args:
+            text (bytes): Raw content of the file.
+            loads (callable): Parser to use, defaults to the JSON backend.
+
+        Returns:
+            The parsed data, or None if the content is not complete yet.
+        """
+        try:
+            return loads(text)
+        except ValueError:
+            # MetaTrader is still writing the file, it is parsed again once complete
+            return None
 
     def try_remove_file(self, file_path):
         """
@@ -164,208 +307,480 @@ class mql_client:
                 # Print stack trace for any other unexpected exceptions
                 print_exc()
 
-    def check_open_orders(self):
+    def watch_files(self):
+        """
+        Waits for changes to the communication files and dispatches them to their handlers.
+
+        This method runs in a single background thread. When watchdog is available, it
+        wakes up only on file system events and rescans all files every
+        `watch_fallback_delay` seconds in case an event was missed. Otherwise it falls
+        back to polling all files every `sleep_delay` seconds.
+        """
+        observer = None
+        poll_delay = self.sleep_delay
+
+        if Observer is not None:
+            try:
+                observer = Observer()
+                # The tick ring buffer stays open in MetaTrader and guards against torn reads itself
+                open_file_names = (basename(self.path_ticks),) if self.use_tick_ring_buffer else ()
+                forwarder = _FileEventForwarder(self._file_events, open_file_names)
+                observer.schedule(forwarder, self.path_mql_stuff, recursive=False)
+                observer.daemon = True
+                observer.start()
+                poll_delay = self.watch_fallback_delay
+            except Exception:
+                # Fall back to polling if the directory cannot be watched
+                print_exc()
+                observer = None
+
+        try:
+            while self.ACTIVE:
+                try:
+                    file_name = self._file_events.get(timeout=poll_delay)
+                except Empty:
+                    file_name = None  # Rescan all files
+
+                if not self.START:
+                    continue  # Skip processing if not started
+
+                if file_name is None:
+                    targets = self._file_handlers.values()
+                elif file_name in self._file_handlers:
+                    targets = (self._file_handlers[file_name],)
+                else:
+                    continue  # Not a file we are interested in
+
+                for file_path, handler in targets:
+                    try:
+                        if file_path == self.path_ticks:
+                            handler()  # Reads only the new slots of the mapped file
+                        else:
+                            handler(self.try_read_file(file_path))
+                    except Exception:
+                        # Keep watching even if a single update cannot be processed
+                        print_exc()
+        finally:
+            if observer is not None:
+                observer.stop()
+
+    def persist_files(self):
         """
-        Continuously monitors the open orders file and triggers events on changes.
+        Writes queued file contents to disk, off the watch thread.
+
+        This method runs in a separate thread. Each file is written to a temporary
+        file first and then moved into place, so a crash mid-write never leaves a
+        truncated file behind. Only the latest queued content of each file is written.
+        The thread stops after writing everything queued before a None sentinel.
+        """
+        stop = False
+        while not stop:
+            item = self._persist_queue.get()
+
+            # Coalesce queued writes so only the latest content of each file is written
+            pending = {}
+            while True:
+                if item is None:
+                    stop = True
+                else:
+                    file_path, content = item
+                    pending[file_path] = content
+                try:
+                    item = self._persist_queue.get_nowait()
+                except Empty:
+                    break
+
+            for file_path, content in pending.items():
+                tmp_path = file_path + '.tmp'
+                try:
+                    with open(tmp_path, 'wb') as f:
+                        f.write(content)
+                    os.replace(tmp_path, file_path)
+                except:
+                    # Print stack trace if writing fails, the next update will retry
+                    print_exc()
+
+    def flush_persisted_files(self):
+        """
+        Writes all queued file contents and stops the persist thread.
+
+        This is called automatically when the interpreter exits, so stored orders and
+        messages are not lost with the daemon thread.
+        """
+        if self.persist_thread.is_alive():
+            self._persist_queue.put(None)
+            self.persist_thread.join()
+
+    def _handle_open_orders(self, text):
+        """
+        Processes the content of the open orders file and triggers events on changes.
 
-        This method runs in a separate thread and checks for updates to open orders.
         It updates internal state and invokes the event handler if there are any
         changes in the orders.
-        """
-        while self.ACTIVE:
-            sleep(self.sleep_delay)
 
-            if not self.START:
-                continue  # Skip processing if not started
+        Args:
+            text (bytes): Raw content of the open orders file.
+        """
+        if len(text.strip()) == 0:
+            return  # No new data to process
 
-            text = self.try_read_file(self.path_orders)
+        text_hash = _hash_bytes(text)
+        if text_hash == self._last_open_orders_hash:
+            return  # No new data to process
 
-            if len(text.strip()) == 0 or text == self._last_open_orders_str:
-                continue  # No new data to process
+        data = self.try_parse_json(text)
+        if data is None:
+            return  # Not completely written yet
 
-            self._last_open_orders_str = text
-            data = json.loads(text)
+        self._last_open_orders_hash = text_hash
 
-            new_event = False
-            # Check for removed orders
-            for order_id, order in self.open_orders.items():
-                if order_id not in data['orders']:
-                    new_event = True
-                    if self.verbose:
-                        print('Order removed: ', order)
+        # Order IDs that were either removed or added since the last update
+        changed_ids = self.open_orders.keys() ^ data['orders'].keys()
+        new_event = bool(changed_ids)
 
-            # Check for new orders
-            for order_id, order in data['orders'].items():
-                if order_id not in self.open_orders:
-                    new_event = True
-                    if self.verbose:
-                        print('New order: ', order)
+        if self.verbose and changed_ids:
+            for order_id in changed_ids:
+                if order_id in self.open_orders:
+                    print('Order removed: ', self.open_orders[order_id])
+                else:
+                    print('New order: ', data['orders'][order_id])
 
-            self.account_info = data['account_info']
-            self.open_orders = data['orders']
+        self.account_info = data['account_info']
+        self.open_orders = data['orders']
 
-            # Optionally store the latest orders to file for persistence
-            if self.load_orders_from_file:
-                with open(self.path_orders_stored, 'w') as f:
-                    f.write(json.dumps(data))
+        # Optionally store the latest orders to file for persistence
+        if self.load_orders_from_file:
+            self._persist_queue.put((self.path_orders_stored, _json_dumps(data)))
 
-            # Trigger the event handler if there are any changes
-            if self.event_handler is not None and new_event:
-                self.event_handler.on_order_event()
+        # Trigger the event handler if there are any changes
+        if self.event_handler is not None and new_event:
+            self.event_handler.on_order_event()
 
-    def check_messages(self):
+    def _handle_messages(self, text):
         """
-        Continuously monitors the messages file and triggers message events.
+        Processes the content of the messages file and triggers message events.
 
-        This method runs in a separate thread and checks for new messages from MetaTrader.
         It updates internal state and invokes the event handler for each new message.
+
+        Args:
+            text (bytes): Raw content of the messages file.
         """
-        while self.ACTIVE:
-            sleep(self.sleep_delay)
+        if len(text.strip()) == 0:
+            return  # No new messages to process
 
-            if not self.START:
-                continue  # Skip processing if not started
+        text_hash = _hash_bytes(text)
+        if text_hash == self._last_messages_hash:
+            return  # No new messages to process
 
-            text = self.try_read_file(self.path_messages)
+        data = self.try_parse_json(text)
+        if data is None:
+            return  # Not completely written yet
 
-            if len(text.strip()) == 0 or text == self._last_messages_str:
-                continue  # No new messages to process
+        self._last_messages_hash = text_hash
 
-            self._last_messages_str = text
-            data = json.loads(text)
+        # Keep only messages newer than the last processed timestamp
+        last_millis = self._last_messages_millis
+        messages = ((int(millis), message) for millis, message in data.items())
+        new_messages = [item for item in messages if item[0] > last_millis]
 
-            # Sort messages by timestamp to ensure chronological processing
-            for millis, message in sorted(data.items()):
-                if int(millis) > self._last_messages_millis:
-                    self._last_messages_millis = int(millis)
-                    # Invoke the message event handler
-                    if self.event_handler is not None:
-                        self.event_handler.on_message(message)
+        # Sort new messages by timestamp to ensure chronological processing
+        new_messages.sort(key=lambda item: item[0])
+        handler = self.event_handler
+        for millis, message in new_messages:
+            self._last_messages_millis = millis
+            # Invoke the message event handler
+            if handler is not None:
+                handler.on_message(message)
 
-            # Optionally store the latest messages to file for persistence
-            with open(self.path_messages_stored, 'w') as f:
-                f.write(json.dumps(data))
+        # Optionally store the latest messages to file for persistence
+        self._persist_queue.put((self.path_messages_stored, _json_dumps(data)))
 
-    def check_market_data(self):
+    def _handle_market_data(self, text):
         """
-        Continuously monitors the market data file and triggers tick events.
+        Processes the content of the market data file and triggers tick events.
 
-        This method runs in a separate thread and checks for updates to market data.
         It updates internal state and invokes the event handler for each tick update.
+
+        Args:
+            text (bytes): Raw content of the market data file.
         """
-        while self.ACTIVE:
-            sleep(self.sleep_delay)
+        if len(text.strip()) == 0:
+            return  # No new market data to process
+
+        text_hash = _hash_bytes(text)
+        if text_hash == self._last_market_data_hash:
+            return  # No new market data to process
+
+        data = self.try_parse_json(text)
+        if data is None:
+            return  # Not completely written yet
 
-            if not self.START:
-                continue  # Skip processing if not started
+        self._last_market_data_hash = text_hash
 
-            text = self.try_read_file(self.path_market_data)
+        self.market_data = data
 
-            if len(text.strip()) == 0 or text == self._last_market_data_str:
-                continue  # No new market data to process
+        # Trigger tick events for symbols with updated bid/ask prices
+        self._dispatch_ticks(*self._changed_ticks(data))
+        self._last_market_data = data
 
-            self._last_market_data_str = text
-            data = json.loads(text)
+    def _changed_ticks(self, data):
+        """
+        Determines which symbols have new market data compared to the last update.
 
-            self.market_data = data
+        A symbol counts as changed if it is new or any field of its record changed.
+        The new prices are gathered in the same pass, so dispatching needs no lookups.
 
-            # Trigger tick events for symbols with updated bid/ask prices
-            if self.event_handler is not None:
-                for symbol in data.keys():
-                    if (symbol not in self._last_market_data or
-                            self.market_data[symbol] != self._last_market_data[symbol]):
-                        self.event_handler.on_tick(
-                            symbol,
-                            self.market_data[symbol]['bid'],
-                            self.market_data[symbol]['ask']
-                        )
-            self._last_market_data = data
+        Args:
+            data (dict): Market data of the current update, by symbol.
 
-    def check_bar_data(self):
+        Returns:
+            tuple[list, list, list]: The changed symbols in update order, and their
+                bid and ask prices.
+        """
+        symbols, bids, asks = [], [], []
+        last_market_data = self._last_market_data
+        for symbol, record in data.items():
+            if (symbol not in last_market_data or
+                    record != last_market_data[symbol]):
+                symbols.append(symbol)
+                bids.append(record['bid'])
+                asks.append(record['ask'])
+        return symbols, bids, asks
+
+    def _handle_tick_ring(self):
         """
-        Continuously monitors the bar data file and triggers bar data events.
+        Reads new ticks from the memory-mapped tick ring buffer and triggers tick events.
 
-        This method runs in a separate thread and checks for updates to bar data.
-        It updates internal state and invokes the event handler for each new bar.
+        MetaTrader only writes the ring buffer when `publishTicksToRingBuffer` is
+        enabled, in which case it replaces the market data file, and it is only read
+        when `use_tick_ring_buffer` is set. Only the slots written since the last
+        call are read, so no JSON is parsed.
+        """
+        # Drop the mapping if MetaTrader deleted or recreated the file, the mtime
+        # changes on every write so only the file identity tells them apart
+        try:
+            st = os.stat(self.path_ticks)
+            file_id = (st.st_dev, st.st_ino)
+        except FileNotFoundError:
+            file_id = None
+        if self._tick_mmap is not None and file_id != self._tick_ring_id:
+            self._tick_mmap.close()
+            self._tick_mmap = None
+            self._tick_ring_tail = 0
+
+        if self._tick_mmap is None:
+            self._tick_mmap = self._map_tick_ring()
+            if self._tick_mmap is None:
+                return  # Ring buffer not available (yet)
+
+        tick_mmap = self._tick_mmap
+        head, = _TICK_RING_HEAD.unpack_from(tick_mmap, 0)
+        tail = self._tick_ring_tail
+
+        if head == tail:
+            return  # No new ticks to process
+        if head < tail:
+            tail = 0  # MetaTrader restarted and reset the ring buffer
+        tail = max(tail, head - _TICK_RING_SLOTS)  # Skip ticks that were already overwritten
+
+        market_data = self.market_data
+        symbols, bids, asks = [], [], []
+        for position in range(tail, head):
+            offset = _TICK_RING_HEAD.size + (position % _TICK_RING_SLOTS) * _TICK_RING_SLOT.size
+            seq, symbol, bid, ask, tick_value = _TICK_RING_SLOT.unpack_from(tick_mmap, offset)
+            # Skip the slot if it was overwritten before or while reading it
+            if seq != position + 1 or _TICK_RING_SEQ.unpack_from(tick_mmap, offset)[0] != seq:
+                continue
+
+            # MetaTrader writes ANSI bytes, latin-1 decodes any of them without failing
+            symbol = symbol.rstrip(b'\0').decode('latin-1')
+            market_data[symbol] = {'bid': bid, 'ask': ask, 'tick_value': tick_value}
+            symbols.append(symbol)
+            bids.append(bid)
+            asks.append(ask)
+
+        self._tick_ring_tail = head
+
+        # Trigger tick events in the order they were published
+        self._dispatch_ticks(symbols, bids, asks)
+
+    def _dispatch_ticks(self, symbols, bids, asks):
         """
-        while self.ACTIVE:
-            sleep(self.sleep_delay)
+        Passes new ticks to the event handler.
 
-            if not self.START:
-                continue  # Skip processing if not started
+        If the event handler defines `on_ticks(symbols, bids, asks)`, all ticks are
+        passed in a single call. Otherwise `on_tick(symbol, bid, ask)` is called for
+        each tick.
 
-            text = self.try_read_file(self.path_bar_data)
+        Args:
+            symbols (list[str]): Symbols of the new ticks.
+            bids (list[float]): Bid prices of the new ticks.
+            asks (list[float]): Ask prices of the new ticks.
+        """
+        handler = self.event_handler
+        if handler is None or not symbols:
+            return
 
-            if len(text.strip()) == 0 or text == self._last_bar_data_str:
-                continue  # No new bar data to process
+        # Look up the batch callback only when the event handler changes
+        if handler is not self._batch_handler:
+            self._batch_handler = handler
+            self._batch_on_ticks = getattr(handler, 'on_ticks', None)
 
-            self._last_bar_data_str = text
-            data = json.loads(text)
+        if self._batch_on_ticks is not None:
+            self._batch_on_ticks(symbols, bids, asks)
+            return
 
-            self.bar_data = data
+        on_tick = handler.on_tick
+        for symbol, bid, ask in zip(symbols, bids, asks):
+            on_tick(symbol, bid, ask)
 
-            # Trigger bar data events for symbols/timeframes with updated data
-            if self.event_handler is not None:
-                for st in data.keys():
-                    if (st not in self._last_bar_data or
-                            self.bar_data[st] != self._last_bar_data[st]):
-                        symbol, time_frame = st.split('_')
-                        self.event_handler.on_bar_data(
-                            symbol,
-                            time_frame,
-                            self.bar_data[st]['time'],
-                            self.bar_data[st]['open'],
-                            self.bar_data[st]['high'],
-                            self.bar_data[st]['low'],
-                            self.bar_data[st]['close'],
-                            self.bar_data[st]['tick_volume']
-                        )
-            self._last_bar_data = data
+    def _map_tick_ring(self):
+        """
+        Memory-maps the tick ring buffer file for reading.
 
-    def check_historic_data(self):
+        Returns:
+            mmap.mmap: The mapped file, or None if it does not exist or is not complete yet.
         """
-        Continuously monitors the historic data and trades files and triggers corresponding events.
+        try:
+            with open(self.path_ticks, 'rb') as f:
+                st = os.fstat(f.fileno())
+                if st.st_size < _TICK_RING_SIZE:
+                    return None
+                self._tick_ring_id = (st.st_dev, st.st_ino)
+                return mmap.mmap(f.fileno(), _TICK_RING_SIZE, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+
+    def _handle_bar_data(self, text):
+        """
+        Processes the content of the bar data file and triggers bar data events.
 
-        This method runs in a separate thread and checks for updates to historic data and trades.
-        It updates internal state and invokes the event handler for each new historic data or trade.
+        It updates internal state and invokes the event handler for each new bar.
+
+        Args:
+            text (bytes): Raw content of the bar data file.
+        """
+        if len(text.strip()) == 0:
+            return  # No new bar data to process
+
+        text_hash = _hash_bytes(text)
+        if text_hash == self._last_bar_data_hash:
+            return  # No new bar data to process
+
+        data = self.try_parse_json(text)
+        if data is None:
+            return  # Not completely written yet
+
+        self._last_bar_data_hash = text_hash
+
+        self.bar_data = data
+
+        # Trigger bar data events for symbols/timeframes with updated data
+        handler = self.event_handler
+        if handler is not None:
+            last = self._last_bar_data
+            split_bar_key = self._split_bar_key
+            for st, bar in data.items():
+                if st not in last or bar != last[st]:
+                    symbol, time_frame = split_bar_key(st)
+                    handler.on_bar_data(
+                        symbol,
+                        time_frame,
+                        bar['time'],
+                        bar['open'],
+                        bar['high'],
+                        bar['low'],
+                        bar['close'],
+                        bar['tick_volume']
+                    )
+        self._last_bar_data = data
+
+    def _split_bar_key(self, st):
         """
-        while self.ACTIVE:
-            sleep(self.sleep_delay)
+        Splits a "SYMBOL_TIMEFRAME" data key into its symbol and timeframe.
 
-            if not self.START:
-                continue  # Skip processing if not started
+        Keys are normally cached when subscribing; unknown keys are split once and cached.
 
-            # Check for historic data updates
-            text = self.try_read_file(self.path_historic_data)
+        Args:
+            st (str): The data key, e.g. "EURUSD_M1".
 
-            if len(text.strip()) > 0 and text != self._last_historic_data_str:
-                self._last_historic_data_str = text
-                data = json.loads(text)
+        Returns:
+            tuple[str, str]: The symbol and timeframe.
+        """
+        pair = self._bar_key_cache.get(st)
+        if pair is None:
+            pair = self._bar_key_cache[st] = tuple(st.split('_'))
+        return pair
 
-                for st in data.keys():
-                    self.historic_data[st] = data[st]
-                    if self.event_handler is not None:
-                        symbol, time_frame = st.split('_')
-                        self.event_handler.on_historic_data(
-                            symbol, time_frame, data[st]
-                        )
+    def _handle_historic_data(self, text):
+        """
+        Processes the content of the historic data file and triggers historic data events.
 
-                # Remove the historic data file after processing
-                self.try_remove_file(self.path_historic_data)
+        It updates internal state, invokes the event handler for each received
+        symbol/timeframe and removes the file afterwards. With `lazy_historic_data`
+        enabled, the bars are passed on as lazy simdjson objects and only materialized
+        when accessed.
 
-            # Check for historic trades updates
-            text = self.try_read_file(self.path_historic_trades)
+        Args:
+            text (bytes): Raw content of the historic data file.
+        """
+        if len(text.strip()) == 0:
+            return  # No new historic data to process
+
+        text_hash = _hash_bytes(text)
+        if text_hash == self._last_historic_data_hash:
+            return  # No new historic data to process
+
+        if self.lazy_historic_data:
+            # A dedicated parser keeps the lazy objects valid for as long as they are referenced
+            data = self.try_parse_json(text, simdjson.Parser().parse)
+        else:
+            data = self.try_parse_json(text)
+        if data is None:
+            return  # Not completely written yet
+
+        self._last_historic_data_hash = text_hash
+
+        handler = self.event_handler
+        historic_data = self.historic_data
+        for st in data.keys():
+            bars = data[st]
+            historic_data[st] = bars
+            if handler is not None:
+                symbol, time_frame = self._split_bar_key(st)
+                handler.on_historic_data(
+                    symbol, time_frame, bars
+                )
+
+        # Remove the historic data file after processing
+        self.try_remove_file(self.path_historic_data)
+
+    def _handle_historic_trades(self, text):
+        """
+        Processes the content of the historic trades file and triggers the historic trades event.
+
+        Args:
+            text (bytes): Raw content of the historic trades file.
+        """
+        if len(text.strip()) == 0:
+            return  # No new historic trades to process
 
-            if len(text.strip()) > 0 and text != self._last_historic_trades_str:
-                self._last_historic_trades_str = text
-                data = json.loads(text)
+        text_hash = _hash_bytes(text)
+        if text_hash == self._last_historic_trades_hash:
+            return  # No new historic trades to process
 
-                self.historic_trades = data
-                # Trigger the historic trades event handler
-                self.event_handler.on_historic_trades()
+        data = self.try_parse_json(text)
+        if data is None:
+            return  # Not completely written yet
 
-                # Remove the historic trades file after processing
-                self.try_remove_file(self.path_historic_trades)
+        self._last_historic_trades_hash = text_hash
+
+        self.historic_trades = data
+        # Trigger the historic trades event handler
+        self.event_handler.on_historic_trades()
+
+        # Remove the historic trades file after processing
+        self.try_remove_file(self.path_historic_trades)
 
     def load_orders(self):
         """
@@ -374,8 +789,8 @@ class mql_client:
         text = self.try_read_file(self.path_orders_stored)
 
         if len(text) > 0:
-            self._last_open_orders_str = text
-            data = json.loads(text)
+            self._last_open_orders_hash = _hash_bytes(text)
+            data = _json_loads(text)
             self.account_info = data['account_info']
             self.open_orders = data['orders']
 
@@ -386,8 +801,8 @@ class mql_client:
         text = self.try_read_file(self.path_messages_stored)
 
         if len(text) > 0:
-            self._last_messages_str = text
-            data = json.loads(text)
+            self._last_messages_hash = _hash_bytes(text)
+            data = _json_loads(text)
 
             # Update the last processed message timestamp
             for millis in data.keys():
@@ -406,6 +821,8 @@ class mql_client:
 
         The received market data will be stored in `self.market_data`, and the
         `event_handler.on_tick()` method will be triggered upon receiving data.
+        If the event handler defines `on_ticks(symbols, bids, asks)`, it is called
+        once per update with all changed symbols instead.
         """
         self.send_command('SUBSCRIBE_SYMBOLS', ','.join(symbols))
 
@@ -423,6 +840,10 @@ class mql_client:
         The received bar data will be stored in `self.bar_data`, and the
         `event_handler.on_bar_data()` method will be triggered upon receiving data.
         """
+        # Cache the split form of the data keys MetaTrader will use for these pairs
+        for symbol, time_frame in symbols:
+            self._bar_key_cache[f'{symbol}_{time_frame}'] = (symbol, time_frame)
+
         # Format each symbol-timeframe pair as "Symbol,Timeframe"
         data = [f'{st[0]},{st[1]}' for st in symbols]
         self.send_command('SUBSCRIBE_SYMBOLS_BAR_DATA',
@@ -450,7 +871,11 @@ class mql_client:
 
         The received historic data will be stored in `self.historic_data`, and the
         `event_handler.on_historic_data()` method will be triggered upon receiving data.
+        If `lazy_historic_data` is enabled, the data is a lazy, read-only `simdjson.Object`
+        supporting the usual mapping access; call `.as_dict()` for a plain dict.
         """
+        self._bar_key_cache[f'{symbol}_{time_frame}'] = (symbol, time_frame)
+
         # Prepare the data payload with symbol, timeframe, start, and end timestamps
         data = [symbol, time_frame, int(start), int(end)]
         self.send_command('GET_HISTORIC_DATA', ','.join(str(p) for p in data))
@@ -579,12 +1004,29 @@ class mql_client:
 
         This should be used when restarting the Python client without restarting MetaTrader.
         """
-        self.command_id = 0  # Reset the command ID counter
+        self._id_counter = count(1)  # Reset the command ID counter
 
         self.send_command("RESET_COMMAND_IDS", "")  # Notify MetaTrader to reset its command IDs
 
         sleep(0.5)  # Wait to ensure the reset command is processed before sending other commands
 
+    async def send_command_async(self, command, content):
+        """
+        Sends a command to the MetaTrader server without blocking the event loop.
+
+        Args:
+            command (str): The command name to send.
+            content (str): The content or parameters associated with the command.
+
+        Returns:
+            None
+
+        Waiting for a free command file happens in the default executor, so concurrent
+        coroutines can send commands in parallel while the event loop keeps running.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.send_command, command, content)
+
     def send_command(self, command, content):
         """
         Sends a command to the MetaTrader server by writing to one of the command files.
@@ -597,36 +1039,49 @@ class mql_client:
             None
 
         This method handles command ID assignment, file selection for writing, and retries
-        in case of file access issues. It ensures that commands are sent in chronological
-        order without overwriting existing commands.
+        in case of file access issues. It never overwrites existing commands; concurrent
+        callers each claim a different command file and do not block each other.
         """
-        self.lock.acquire()  # Acquire lock to ensure thread-safe command sending
+        command_id = next(self._id_counter) % 100000  # Take the next ID, wrapping around
 
-        self.command_id = (self.command_id + 1) % 100000  # Increment and wrap the command ID
+        # Encode the command once in the specified format
+        payload = f'<:{command_id}|{command}|{content}:>'.encode('utf-8')
 
         # Calculate the end time for retry attempts
-        end_time = datetime.now(timezone.utc) + timedelta(seconds=self.max_retry_command_seconds)
-        now = datetime.now(timezone.utc)
+        end_time = monotonic() + self.max_retry_command_seconds
 
         # Retry loop in case all command files are occupied
-        while now < end_time:
+        while monotonic() < end_time:
             success = False
+            # List the directory once to skip command files that are still occupied
+            try:
+                with os.scandir(self.path_mql_stuff) as entries:
+                    occupied = {entry.name for entry in entries}
+            except OSError:
+                occupied = set()
             # Iterate through available command files to find an empty one
-            for i in range(self.num_command_files):
-                file_path = f'{self.path_commands_prefix}{i}.txt'
-                if not exists(file_path):
-                    try:
-                        # Write the command to the selected file in the specified format
-                        with open(file_path, 'w') as f:
-                            f.write(f'<:{self.command_id}|{command}|{content}:>')
-                        success = True
-                        break  # Exit loop if command is successfully written
-                    except:
-                        # Print stack trace if writing fails and try the next file
-                        print_exc()
+            for file_name, file_path in zip(self._command_file_names, self._command_paths):
+                if file_name in occupied:
+                    continue  # Command file is still occupied, try the next one
+                try:
+                    # Atomically claim the command file, failing if it already exists
+                    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+                except FileExistsError:
+                    continue  # Command file is still occupied, try the next one
+                except:
+                    # Print stack trace if the file cannot be created and try the next file
+                    print_exc()
+                    continue
+                try:
+                    os.write(fd, payload)  # Write the command to the claimed file
+                    success = True
+                except:
+                    # Print stack trace if writing fails and try the next file
+                    print_exc()
+                finally:
+                    os.close(fd)
+                if success:
+                    break  # Exit loop if command is successfully written
             if success:
                 break  # Exit retry loop if command was successfully sent
             sleep(self.sleep_delay)  # Wait before retrying
-            now = datetime.now(timezone.utc)
-
-        self.lock.release()  # Release the lock after attempting to send the command